@@ -120,7 +120,9 @@ h_ctf_fb = [filt.fb_mat(ffbbasis) for filt in ctf_filters]
 logger.info("Apply CTF filters to clean images.")
 imgs_clean = sim.projections()
 imgs_ctf_clean = sim.clean_images()
-power_clean = imgs_ctf_clean.norm() ** 2 / imgs_ctf_clean.size
+# The signal power is a mean of squares, computed directly with a single dot product.
+imgs_ctf_clean_flat = imgs_ctf_clean.asnumpy().ravel()
+power_clean = np.vdot(imgs_ctf_clean_flat, imgs_ctf_clean_flat) / imgs_ctf_clean.size
 sn_ratio = power_clean / noise_var
 logger.info(f"Signal to noise ratio is {sn_ratio}.")
 
@@ -179,7 +181,7 @@ covar_opt = {
     "iter_callback": [],
     "store_iterates": False,
     "rel_tolerance": 1e-12,
-    "precision": "float64",
+    "precision": dtype,
     "preconditioner": "identity",
 }
 mean_coeff_est = cov2d.get_mean(coeff_noise, h_ctf_fb, h_idx)
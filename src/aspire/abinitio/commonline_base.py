@@ -463,17 +463,11 @@ class CLOrient3D:
         """
         Generate two index lists for [i, j] pairs of images
         """
-        idx_i = []
-        idx_j = []
-        for i in range(self.n_img - 1):
-            tmp_j = range(i + 1, self.n_img)
-            idx_i.extend([i] * len(tmp_j))
-            idx_j.extend(tmp_j)
-        idx_i = np.array(idx_i, dtype="int")
-        idx_j = np.array(idx_j, dtype="int")
+        # All pairs i < j, ordered by i and then by j.
+        idx_i, idx_j = np.triu_indices(self.n_img, k=1)
 
         # Select random pairs based on the size of n_equations
-        rp = choice(np.arange(len(idx_j)), size=n_equations, replace=False)
+        rp = choice(len(idx_j), size=n_equations, replace=False)
 
         return idx_i[rp], idx_j[rp]
 
@@ -393,9 +393,8 @@ class Picker:
         y -= 1
         center = center[y, :]
 
-        center = center + (self.query_size // 2 - 1) * np.ones(center.shape)
-        center = center + (self.query_size // 2 - 1) * np.ones(center.shape)
-        center = center + np.ones(center.shape)
+        # two half query window shifts, plus one to correct for 1-based indexing
+        center += 2 * (self.query_size // 2 - 1) + 1
 
         center = config.apple.mrc_shrink_factor * center
 
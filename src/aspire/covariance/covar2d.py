@@ -97,6 +97,18 @@ class RotCov2D:
         self.basis = basis
         self.dtype = self.basis.dtype
         ensure(basis.ndim == 2, "Only two-dimensional basis functions are needed.")
+        # Block partition of CTFs expanded in `basis`, computed on first use.
+        self._ctf_fb_partition = None
+
+    def _identity_ctf_fb(self):
+        """
+        Identity CTF in the FB basis, used when no CTF information is given.
+
+        :return: List holding one identity BlkDiagMatrix, in the form of `ctf_fb`.
+        """
+        if self._ctf_fb_partition is None:
+            self._ctf_fb_partition = RadialCTFFilter().fb_mat(self.basis).partition
+        return [BlkDiagMatrix.eye(self._ctf_fb_partition, dtype=self.dtype)]
 
     def _get_mean(self, coeffs):
         """
@@ -163,7 +175,7 @@ class RotCov2D:
                 )
 
                 hsize = covar_ell_diag.shape[0]
-                covar_coeff_blk = np.zeros((2, hsize, 2, hsize))
+                covar_coeff_blk = np.zeros((2, hsize, 2, hsize), dtype=coeffs.dtype)
 
                 covar_coeff_blk[0:2, :, 0:2, :] = covar_ell_diag[:hsize, :hsize]
                 covar_coeff_blk[0, :, 1, :] = covar_ell_off[:hsize, :hsize]
@@ -190,11 +202,7 @@ class RotCov2D:
         # should assert we require none or both...
         if (ctf_fb is None) or (ctf_idx is None):
             ctf_idx = np.zeros(coeffs.shape[0], dtype=int)
-            ctf_fb = [
-                BlkDiagMatrix.eye_like(
-                    RadialCTFFilter().fb_mat(self.basis), dtype=self.dtype
-                )
-            ]
+            ctf_fb = self._identity_ctf_fb()
 
         b = np.zeros(self.basis.count, dtype=coeffs.dtype)
 
@@ -249,11 +257,7 @@ class RotCov2D:
 
         if (ctf_fb is None) or (ctf_idx is None):
             ctf_idx = np.zeros(coeffs.shape[0], dtype=int)
-            ctf_fb = [
-                BlkDiagMatrix.eye_like(
-                    RadialCTFFilter().fb_mat(self.basis), dtype=self.dtype
-                )
-            ]
+            ctf_fb = self._identity_ctf_fb()
 
         def identity(x):
             return x
@@ -319,11 +323,30 @@ class RotCov2D:
                 " is not positive semidefinite."
             )
 
-        # RCOPT okay, this looks like a big batch, come back later
+        covar_coeff = self._solve_covar(A, b, M, covar_est_opt)
 
-        cg_opt = covar_est_opt
+        if not covar_coeff.check_psd():
+            logger.warning("Covariance matrix in Cov2D is not positive semidefinite.")
+            if make_psd:
+                logger.info("Convert matrices to positive semidefinite.")
+                covar_coeff = covar_coeff.make_psd()
 
-        covar_coeff = BlkDiagMatrix.zeros_like(ctf_fb[0])
+        return covar_coeff
+
+    def _solve_covar(self, A_covar, b_covar, M, covar_est_opt):
+        """
+        Solve the normal equations for the block diagonal covariance matrix.
+
+        Each diagonal block is an independent linear system, solved by
+        preconditioned conjugate gradient.
+
+        :param A_covar: List of BlkDiagMatrix instances, one per CTF, defining the
+            linear operator of the normal equations.
+        :param b_covar: The right-hand side as a BlkDiagMatrix instance.
+        :param M: BlkDiagMatrix whose blockwise inverses define the preconditioner.
+        :param covar_est_opt: The optimization parameters passed to `conj_grad`.
+        :return: The covariance matrix as a BlkDiagMatrix instance.
+        """
 
         def precond_fun(S, x):
             p = np.size(S, 0)
@@ -342,22 +365,22 @@ class RotCov2D:
             y = m_reshape(y, (p ** 2,))
             return y
 
-        for ell in range(0, len(b)):
+        def solve_block(ell):
             A_ell = []
-            for k in range(0, len(A)):
-                A_ell.append(A[k][ell])
+            for k in range(0, len(A_covar)):
+                A_ell.append(A_covar[k][ell])
             p = np.size(A_ell[0], 0)
-            b_ell = m_reshape(b[ell], (p ** 2,))
+            b_ell = m_reshape(b_covar[ell], (p ** 2,))
             S = inv(M[ell])
-            cg_opt["preconditioner"] = lambda x: precond_fun(S, x)
+            # Each block gets its own options, since the preconditioner differs.
+            cg_opt = dict(covar_est_opt, preconditioner=lambda x: precond_fun(S, x))
             covar_coeff_ell, _, _ = conj_grad(lambda x: apply(A_ell, x), b_ell, cg_opt)
-            covar_coeff[ell] = m_reshape(covar_coeff_ell, (p, p))
+            return m_reshape(covar_coeff_ell, (p, p))
 
-        if not covar_coeff.check_psd():
-            logger.warning("Covariance matrix in Cov2D is not positive semidefinite.")
-            if make_psd:
-                logger.info("Convert matrices to positive semidefinite.")
-                covar_coeff = covar_coeff.make_psd()
+        covar_coeff = BlkDiagMatrix.zeros_like(b_covar)
+
+        for ell in range(len(b_covar)):
+            covar_coeff[ell] = solve_block(ell)
 
         return covar_coeff
 
@@ -627,42 +650,6 @@ class BatchedRotCov2D(RotCov2D):
 
         return b_covar
 
-    def _solve_covar(self, A_covar, b_covar, M, covar_est_opt):
-        ctf_fb = self.ctf_fb
-
-        def precond_fun(S, x):
-            p = np.size(S, 0)
-            ensure(np.size(x) == p * p, "The sizes of S and x are not consistent.")
-            x = m_reshape(x, (p, p))
-            y = S @ x @ S
-            y = m_reshape(y, (p ** 2,))
-            return y
-
-        def apply(A, x):
-            p = np.size(A[0], 0)
-            x = m_reshape(x, (p, p))
-            y = np.zeros_like(x)
-            for k in range(0, len(A)):
-                y = y + A[k] @ x @ A[k].T
-            y = m_reshape(y, (p ** 2,))
-            return y
-
-        cg_opt = covar_est_opt
-        covar_coeff = BlkDiagMatrix.zeros_like(ctf_fb[0])
-
-        for ell in range(0, len(b_covar)):
-            A_ell = []
-            for k in range(0, len(A_covar)):
-                A_ell.append(A_covar[k][ell])
-            p = np.size(A_ell[0], 0)
-            b_ell = m_reshape(b_covar[ell], (p ** 2,))
-            S = inv(M[ell])
-            cg_opt["preconditioner"] = lambda x: precond_fun(S, x)
-            covar_coeff_ell, _, _ = conj_grad(lambda x: apply(A_ell, x), b_ell, cg_opt)
-            covar_coeff[ell] = m_reshape(covar_coeff_ell, (p, p))
-
-        return covar_coeff
-
     def get_mean(self):
         """
         Calculate the rotationally invariant mean image in the basis
@@ -719,11 +719,12 @@ def estimate_ctf(
     dtype = np.dtype(dtype)
     assert dtype in (np.float32, np.float64)
 
-    dir_content = os.scandir(data_folder)
-
-    mrc_files = [f.name for f in dir_content if os.path.splitext(f)[1] == ".mrc"]
-    mrcs_files = [f.name for f in dir_content if os.path.splitext(f)[1] == ".mrcs"]
-    file_names = mrc_files + mrcs_files
+    # Scan the folder once, collecting the .mrc micrographs.
+    #   .mrcs particle stacks are not micrographs and are skipped.
+    with os.scandir(data_folder) as dir_content:
+        file_names = [
+            f.name for f in dir_content if os.path.splitext(f.name)[1] == ".mrc"
+        ]
 
     amp = amplitude_contrast
     amplitude_contrast = np.arctan(
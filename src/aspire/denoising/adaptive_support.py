@@ -1,16 +1,86 @@
 import logging
+from functools import lru_cache
 
 import numpy as np
 
 from aspire.noise import WhiteNoiseEstimator
 from aspire.numeric import fft
 from aspire.source import ImageSource
-from aspire.utils.coor_trans import grid_2d
 
 logger = logging.getLogger(__name__)
 
 
-def adaptive_support(img_src, energy_threshold=0.99):
+def _track_index(r2, N):
+    """
+    Integer radial track, floor(sqrt(r2)), of integer squared radii `r2`.
+
+    Found by a search among the squared track boundaries, so no square roots are taken.
+    Radii beyond the last of the N tracks are all assigned to track N.
+
+    :param r2: Array of (integer) squared radii.
+    :param N: Number of tracks.
+    :return: Array of track indices, shaped like `r2`.
+    """
+    return np.searchsorted(np.arange(N + 1) ** 2, r2, side="right") - 1
+
+
+@lru_cache(maxsize=8)
+def _radial_bins(L):
+    """
+    Integer radial track of every pixel of an L x L image, and the pixel count of each track.
+
+    Cached, since the grid only depends on `L`.
+    The returned arrays are shared between calls and marked read-only.
+
+    :param L: Image size in pixels.
+    :return: (rbin, counts), raveled track index of each pixel and the
+        (at least 1) number of pixels in each of the L // 2 tracks.
+    """
+    N = L // 2
+    # Integer pixel coordinates, matching the unnormalized, unshifted `grid_2d`.
+    grid = np.arange(-N, L - N)
+    r2 = grid[:, np.newaxis] ** 2 + grid[np.newaxis, :] ** 2
+    rbin = _track_index(r2, N).ravel()
+    counts = np.maximum(np.bincount(rbin, minlength=N)[:N], 1)
+
+    rbin.flags.writeable = False
+    counts.flags.writeable = False
+    return rbin, counts
+
+
+@lru_cache(maxsize=8)
+def _radial_bins_rfft(L):
+    """
+    Integer radial track of every frequency in the non-negative half plane returned by `rfft2`,
+    along with the weight of each frequency and the weighted count of each track.
+
+    Every column of that half plane, except the zero (and for even L, Nyquist)
+    frequency, also stands for its mirror image in the discarded half, and has weight 2.
+
+    :param L: Image size in pixels.
+    :return: (rbin_f, weights_f, counts_f), with `rbin_f` and `weights_f` raveled.
+    """
+    N = L // 2
+    # Integer frequencies, in the (unshifted) order used by the FFT.
+    kx = np.fft.ifftshift(np.arange(-N, L - N))
+    ky = np.arange(L // 2 + 1)
+    r2_f = kx[:, np.newaxis] ** 2 + ky[np.newaxis, :] ** 2
+    weights_f = np.full(L // 2 + 1, 2.0)
+    weights_f[0] = 1
+    if L % 2 == 0:
+        weights_f[-1] = 1
+    weights_f = np.broadcast_to(weights_f, r2_f.shape).ravel()
+
+    rbin_f = _track_index(r2_f, N).ravel()
+    counts_f = np.bincount(rbin_f, weights=weights_f, minlength=N)[:N]
+    counts_f = np.maximum(counts_f, 1)
+
+    for arr in (rbin_f, weights_f, counts_f):
+        arr.flags.writeable = False
+    return rbin_f, weights_f, counts_f
+
+
+def adaptive_support(img_src, energy_threshold=0.99, batch_size=512):
     """
     Determine size of the compact support in both real and Fourier Space.
 
@@ -22,6 +92,7 @@ def adaptive_support(img_src, energy_threshold=0.99):
 
     :param img_src: Input `Source` of images.
     :param energy_threshold: [0, 1] threshold limit
+    :param batch_size: Number of images loaded and transformed at a time.
     :return: (c_limit, R_limit)
     """
 
@@ -37,37 +108,49 @@ def adaptive_support(img_src, energy_threshold=0.99):
     L = img_src.L
     N = L // 2
 
-    r = grid_2d(L, shifted=False, normalized=False, dtype=img_src.dtype)["r"]
+    # Radial tracks (floor of the radius) in real space, and in the half plane of `rfft2`.
+    #   Images are real, so their power spectrum is symmetric and we only compute
+    #   the non-negative half of the last frequency axis.
+    rbin, counts = _radial_bins(L)
+    rbin_f, weights_f, counts_f = _radial_bins_rfft(L)
 
     # Estimate noise
     noise_est = WhiteNoiseEstimator(img_src)
     noise_var = noise_est.estimate()
 
-    # Transform to Fourier space
-    img = img_src.images(0, img_src.n).asnumpy()
-    imgf = fft.centered_fft2(img)
-
     # Compute the Variance and Power Spectrum
-    #   Mean along image stack.
-    variance_map = np.mean(np.abs(img) ** 2, axis=0)
-    pspec = np.mean(np.abs(imgf) ** 2, axis=0)
+    #   Mean along image stack, accumulated one batch at a time
+    #   so that only `batch_size` images and their transforms are in memory.
+    variance_map = np.zeros((L, L), dtype=np.float64)
+    pspec = np.zeros((L, L // 2 + 1), dtype=np.float64)
+    for start in range(0, img_src.n, batch_size):
+        img = img_src.images(start, batch_size).asnumpy()
+        # Transform to Fourier space
+        imgf = fft.rfft2(img)
+
+        # Fused square-and-sum along the stack, without |x|**2 temporaries.
+        variance_map += np.einsum("ijk,ijk->jk", img, img)
+        pspec += np.einsum("ijk,ijk->jk", imgf.real, imgf.real)
+        pspec += np.einsum("ijk,ijk->jk", imgf.imag, imgf.imag)
+
+    variance_map /= img_src.n
+    pspec /= img_src.n
 
     # Compute the Radial Variance and Radial Power Spectrum
-    radial_var = np.zeros(N)
-    radial_pspec = np.zeros(N)
-    for i in range(N):
-        mask = (r >= i) & (r < i + 1)
-        # Mean along radial track defined by mask
-        radial_var[i] = np.mean(variance_map[mask])
-        radial_pspec[i] = np.mean(pspec[mask])
-
-    # Subtract the noise variance
-    radial_pspec -= noise_var
-    radial_var -= noise_var
-
-    # Lower bound variance and power by 0
-    np.clip(radial_pspec, 0, a_max=None, out=radial_pspec)
-    np.clip(radial_var, 0, a_max=None, out=radial_var)
+    #   Each pixel belongs to the integer radial track floor(r),
+    #   so the mean along every track is a weighted bincount.
+    radial_var = np.bincount(rbin, weights=variance_map.ravel(), minlength=N)[:N]
+    radial_var /= counts
+
+    pspec_f = weights_f * pspec.ravel()
+    radial_pspec = np.bincount(rbin_f, weights=pspec_f, minlength=N)[:N]
+    radial_pspec /= counts_f
+
+    # Subtract the noise variance and lower bound variance and power by 0,
+    #   both in place.
+    for radial in (radial_pspec, radial_var):
+        np.subtract(radial, noise_var, out=radial)
+        np.maximum(radial, 0, out=radial)
 
     # Construct range of Fourier limits. We need a half-sample correction
     # since each ring is centered between two integer radii. Same for spatial
@@ -88,21 +171,28 @@ def adaptive_support(img_src, energy_threshold=0.99):
     #   but then only uses divided by L... so just removed here.
     #   This makes it consistent with Nyquist, ie [0, .5]
     # Second note, we attempt to find the cutoff,
-    #   but when a search fails returns the last (-1) element,
-    #   essentially the maximal radius.
+    #   the first track whose cumulative energy exceeds the threshold.
+    #   The cumulative energies are non-decreasing, so this is a binary search.
+    #   When the search fails we return the last (-1) element,
+    #   essentially the maximal radius, and when the very first track
+    #   already exceeds the threshold we return the first (0) element.
     # Third note, to increase accuracy, we take a weighted average of the two
     #   points around the cutoff. This mostly affects c since R is rounded.
 
-    ind = np.argmax(cum_pspec > c_energy_threshold)
-    if ind > 0:
+    ind = np.searchsorted(cum_pspec, c_energy_threshold, side="right")
+    if ind == 0:
+        c_limit = c[0]
+    elif ind < N:
         c_limit = (cum_pspec[ind - 1] * c[ind - 1] + cum_pspec[ind] * c[ind]) / (
             cum_pspec[ind - 1] + cum_pspec[ind]
         )
     else:
         c_limit = c[-1]
 
-    ind = np.argmax(cum_var > R_energy_threshold)
-    if ind > 0:
+    ind = np.searchsorted(cum_var, R_energy_threshold, side="right")
+    if ind == 0:
+        R_limit = R[0]
+    elif ind < N:
         R_limit = round(
             (cum_var[ind - 1] * R[ind - 1] + cum_var[ind] * R[ind])
             / (cum_var[ind - 1] + cum_var[ind])
@@ -18,6 +18,9 @@ class FFT:
     def ifft2(self, x, axes=(-2, -1), workers=-1):
         raise NotImplementedError("subclasses must implement this")
 
+    def rfft2(self, x, axes=(-2, -1), workers=-1):
+        raise NotImplementedError("subclasses must implement this")
+
     def fftn(self, x, axes=None, workers=-1):
         raise NotImplementedError("subclasses must implement this")
 
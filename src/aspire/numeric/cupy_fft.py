@@ -22,6 +22,9 @@ class CupyFFT(FFT):
     def ifft2(self, x, axes=(-2, -1), workers=-1):
         return cp.fft.ifft2(x, axes=axes)
 
+    def rfft2(self, x, axes=(-2, -1), workers=-1):
+        return cp.fft.rfft2(x, axes=axes)
+
     def fftn(self, x, axes=None, workers=-1):
         return cp.fft.fftn(x, axes=axes)
 
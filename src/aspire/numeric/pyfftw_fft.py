@@ -112,6 +112,25 @@ class PyfftwFFT(FFT):
 
         return b
 
+    def rfft2(self, a, axes=(-2, -1), workers=-1):
+        mutex.acquire()
+
+        comp_type = complex_type(a.dtype)
+        # Only the non-negative frequencies of the last axis are computed.
+        out_shape = list(a.shape)
+        out_shape[axes[-1]] = a.shape[axes[-1]] // 2 + 1
+        try:
+            a_ = pyfftw.empty_aligned(a.shape, dtype=a.dtype)
+            b = pyfftw.empty_aligned(out_shape, dtype=comp_type)
+            cls = pyfftw.FFTW(
+                a_, b, axes=axes, direction="FFTW_FORWARD", threads=_workers(workers)
+            )
+            cls(a, b)
+        finally:
+            mutex.release()
+
+        return b
+
     def fftn(self, a, axes=None, workers=-1):
         mutex.acquire()
 
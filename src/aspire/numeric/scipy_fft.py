@@ -22,6 +22,9 @@ class ScipyFFT(FFT):
     def ifft2(self, x, axes=(-2, -1), workers=-1):
         return sp.fft.ifft2(x, axes=axes, workers=workers)
 
+    def rfft2(self, x, axes=(-2, -1), workers=-1):
+        return sp.fft.rfft2(x, axes=axes, workers=workers)
+
     def fftn(self, x, axes=None, workers=-1):
         return sp.fft.fftn(x, axes=axes, workers=workers)
 
@@ -209,6 +209,27 @@ class BlkDiagMatrix:
 
         self.__check_dtype_compatible(other)
 
+    def _shape_groups(self):
+        """
+        Group the blocks of `self` by shape.
+
+        Block diagonal matrices arising from steerable bases typically repeat a
+        small number of block shapes, so operations performed independently per
+        block may instead be performed on stacks of equally shaped blocks,
+        one batched LAPACK call or matmul per group.
+
+        :return: List of arrays, each holding the (ascending) indices of all
+            blocks sharing one shape. Empty blocks are omitted.
+        """
+
+        shapes, inverse = np.unique(self.partition, axis=0, return_inverse=True)
+
+        return [
+            np.flatnonzero(inverse == j)
+            for j, shape in enumerate(shapes)
+            if np.prod(shape) > 0
+        ]
+
     @property
     def is_square(self):
         """
@@ -595,7 +616,14 @@ class BlkDiagMatrix:
         :return: The norm of the BlkDiagMatrix instance.
         """
 
-        return np.max([norm(blk, ord=2) for blk in self])
+        return np.max(
+            np.concatenate(
+                [
+                    norm(np.stack([self[i] for i in idx]), ord=2, axis=(1, 2))
+                    for idx in self._shape_groups()
+                ]
+            )
+        )
 
     def transpose(self):
         """
@@ -681,9 +709,14 @@ class BlkDiagMatrix:
         cols = np.array([np.size(Y, 1)])
         cellarray = Cell2D(rows, cols, dtype=Y.dtype)
         Y = cellarray.mat2cell(Y, rows, cols)
-        X = []
-        for i in range(0, self.nblocks):
-            X.append(solve(self[i], Y[i]))
+        # Empty blocks keep their (empty) slice of `Y`.
+        X = list(Y)
+        for idx in self._shape_groups():
+            group_X = solve(
+                np.stack([self[i] for i in idx]), np.stack([Y[i] for i in idx])
+            )
+            for i, blk_X in zip(idx, group_X):
+                X[i] = blk_X
         X = np.concatenate(X, axis=0)
 
         if vector:
@@ -717,10 +750,17 @@ class BlkDiagMatrix:
         )
         cellarray = Cell2D(cols, rows, dtype=X.dtype)
         x_cell = cellarray.mat2cell(X, cols, rows)
-        Y = []
-        for i in range(0, self.nblocks):
-            mat = self[i] @ x_cell[i]
-            Y.append(mat)
+        Y = [None] * self.nblocks
+        for idx in self._shape_groups():
+            group_Y = np.stack([self[i] for i in idx]) @ np.stack(
+                [x_cell[i] for i in idx]
+            )
+            for i, blk_Y in zip(idx, group_Y):
+                Y[i] = blk_Y
+        # Empty blocks map to (possibly empty) zero rows.
+        for i in range(self.nblocks):
+            if Y[i] is None:
+                Y[i] = np.zeros((self.partition[i, 0], np.size(X, 1)), dtype=X.dtype)
         Y = np.concatenate(Y, axis=0)
 
         if vector:
@@ -753,7 +793,12 @@ class BlkDiagMatrix:
         :return: Array of eigvals, with length equal to the fully expanded matrix diagonal.
 
         """
-        return np.concatenate([np.linalg.eigvals(blk).flatten() for blk in self])
+        vals = [np.empty(0, dtype=self.dtype)] * self.nblocks
+        for idx in self._shape_groups():
+            group_vals = np.linalg.eigvals(np.stack([self[i] for i in idx]))
+            for i, blk_vals in zip(idx, group_vals):
+                vals[i] = blk_vals
+        return np.concatenate(vals)
 
     def check_psd(self):
         """
@@ -349,13 +349,29 @@ class ImageSource:
 
         im = im_orig.copy()
 
+        if not self.unique_filters:
+            return im
+
         if indices is None:
             indices = np.arange(start, min(start + num, self.n))
 
+        # Sort the images by filter once, so that the images sharing each filter
+        #   form one contiguous slab, instead of masking the stack per filter.
+        filter_indices = self.filter_indices[indices]
+        order = np.argsort(filter_indices, kind="stable")
+        bounds = np.searchsorted(
+            filter_indices[order], np.arange(len(self.unique_filters) + 1)
+        )
+
+        im_sorted = im[order]
         for i, filt in enumerate(self.unique_filters):
-            idx_k = np.where(self.filter_indices[indices] == i)[0]
-            if len(idx_k) > 0:
-                im[idx_k] = Image(im[idx_k]).filter(filt).asnumpy()
+            k_start, k_end = bounds[i], bounds[i + 1]
+            if k_end > k_start:
+                im_sorted[k_start:k_end] = (
+                    Image(im_sorted[k_start:k_end]).filter(filt).asnumpy()
+                )
+
+        im[order] = im_sorted
 
         return im
 
@@ -363,16 +379,21 @@ class ImageSource:
         grid2d = grid_2d(L, dtype=self.dtype)
         omega = np.pi * np.vstack((grid2d["x"].flatten(), grid2d["y"].flatten()))
 
-        h = np.empty((omega.shape[-1], len(self.filter_indices)), dtype=self.dtype)
-        for i, filt in enumerate(self.unique_filters):
-            idx_k = np.where(self.filter_indices == i)[0]
-            if len(idx_k) > 0:
-                filter_values = filt.evaluate(omega)
-                if power != 1:
-                    filter_values **= power
-                h[:, idx_k] = np.column_stack((filter_values,) * len(idx_k))
+        # Fetch the filter indices from the metadata once, as a contiguous integer array.
+        filter_indices = np.ascontiguousarray(self.filter_indices, dtype=int)
+
+        # Evaluate each filter in use once, then gather its values for all of its images.
+        h_unique = np.zeros(
+            (omega.shape[-1], len(self.unique_filters)), dtype=self.dtype
+        )
+        for i in np.unique(filter_indices):
+            filter_values = self.unique_filters[i].evaluate(omega)
+            if power != 1:
+                filter_values **= power
+            h_unique[:, i] = filter_values
+        h = h_unique[:, filter_indices]
 
-        h = np.reshape(h, grid2d["x"].shape + (len(self.filter_indices),))
+        h = np.reshape(h, grid2d["x"].shape + (len(filter_indices),))
 
         return h
 
@@ -788,7 +809,7 @@ class ArrayImageSource(ImageSource):
 
         # Create filter indices, these are required to pass unharmed through filter eval code
         #   that is potentially called by other methods later.
-        self.filter_indices = np.zeros(self.n)
+        self.filter_indices = np.zeros(self.n, dtype=int)
         self.unique_filters = [IdentityFilter()]
 
         # Optionally populate angles/rotations.
@@ -83,12 +83,14 @@ class RelionSource(ImageSource):
         if n == 0:
             raise RuntimeError("No mrcs files found for starfile!")
 
-        # Peek into the first image and populate some attributes
+        # Peek into the header of the first image file and populate some attributes.
+        #   Only the header is read, the image data itself is not needed here.
         first_mrc_filepath = metadata.loc[0]["__mrc_filepath"]
-        mrc = mrcfile.open(first_mrc_filepath)
+        with mrcfile.open(first_mrc_filepath, header_only=True) as mrc:
+            header = mrc.header
 
         # Get the 'mode' (data type) - TODO: There's probably a more direct way to do this.
-        mode = int(mrc.header.mode)
+        mode = int(header.mode)
         dtypes = {0: "int8", 1: "int16", 2: "float32", 6: "uint16"}
         ensure(
             mode in dtypes,
@@ -96,12 +98,9 @@ class RelionSource(ImageSource):
         )
         dtype = dtypes[mode]
 
-        shape = mrc.data.shape
-        # the code below  accounts for the case where the first MRCS image in the STAR file has one image
-        # in that case, the shape will be (resolution, resolution), whereas this code expects
-        # (1, resolution, resolution). below, the shape is expanded to accomodate this expectation
-        if len(shape) == 2:
-            shape = (1,) + shape
+        # Note that an MRCS file holding a single image has nz == 1,
+        # so this is always (n_images, resolution, resolution).
+        shape = (int(header.nz), int(header.ny), int(header.nx))
 
         ensure(shape[1] == shape[2], "Only square images are supported")
         L = shape[1]
@@ -110,6 +109,11 @@ class RelionSource(ImageSource):
         # Save original image resolution that we expect to use when we start reading actual data
         self._original_resolution = L
 
+        # Resolve every image to the .mrcs file containing it, and its (0-based) position
+        # within that file, once. `_images` then works on these integer arrays directly.
+        self._mrc_codes, self._mrc_filepaths = pd.factorize(metadata["__mrc_filepath"])
+        self._mrc_indices = metadata["__mrc_index"].to_numpy() - 1
+
         filter_params, filter_indices = np.unique(
             metadata[
                 [
@@ -152,42 +156,60 @@ class RelionSource(ImageSource):
     def _images(self, start=0, num=np.inf, indices=None):
         if indices is None:
             indices = np.arange(start, min(start + num, self.n))
-        else:
-            start = indices.min()
-        logger.info(f"Loading {len(indices)} images from STAR file")
 
-        def load_single_mrcs(filepath, df):
-            arr = mrcfile.open(filepath).data
-            # if the stack only contains one image, arr will have shape (resolution, resolution)
-            # the code below reshapes it to (1, resolution, resolution)
-            if len(arr.shape) == 2:
-                arr = arr.reshape((1,) + arr.shape)
-            data = arr[df["__mrc_index"] - 1, :, :]
+        # Nothing to read, and no reader threads to start.
+        if len(indices) == 0:
+            return Image(
+                np.empty(
+                    (0, self._original_resolution, self._original_resolution),
+                    dtype=self.dtype,
+                )
+            )
+
+        logger.info(f"Loading {len(indices)} images from STAR file")
 
-            return df.index, data
+        def load_single_mrcs(filepath, rows):
+            # Each .mrcs file is opened once per call, for all of its requested images,
+            # and closed as soon as those images have been copied out.
+            # The file is memory-mapped, so only the pages holding the requested
+            # images are actually read from disk, not the whole stack.
+            with mrcfile.mmap(filepath, mode="r") as mrc:
+                arr = mrc.data
+                # if the stack only contains one image, arr will have shape (resolution, resolution)
+                # the code below reshapes it to (1, resolution, resolution)
+                if len(arr.shape) == 2:
+                    arr = arr.reshape((1,) + arr.shape)
+                data = arr[self._mrc_indices[indices[rows]], :, :]
+
+            return rows, data
 
         n_workers = self.n_workers
         if n_workers < 0:
-            n_workers = cpu_count() - 1
+            # Leave one core free, but always use at least one thread (e.g. on single core machines).
+            n_workers = max(1, cpu_count() - 1)
 
-        df = self._metadata.loc[indices]
         im = np.empty(
             (len(indices), self._original_resolution, self._original_resolution),
             dtype=self.dtype,
         )
 
-        groups = df.groupby("__mrc_filepath")
-        n_workers = min(n_workers, len(groups))
+        # Group the requested rows of `im` by the .mrcs file they are read from.
+        codes = self._mrc_codes[indices]
+        order = np.argsort(codes, kind="stable")
+        groups = np.split(order, np.flatnonzero(np.diff(codes[order])) + 1)
+        # Reading distinct files is I/O bound, so each file gets its own thread up to `n_workers`.
+        n_workers = max(1, min(n_workers, len(groups)))
 
         with futures.ThreadPoolExecutor(n_workers) as executor:
             to_do = []
-            for filepath, _df in groups:
-                future = executor.submit(load_single_mrcs, filepath, _df)
+            for rows in groups:
+                filepath = self._mrc_filepaths[codes[rows[0]]]
+                future = executor.submit(load_single_mrcs, filepath, rows)
                 to_do.append(future)
 
             for future in futures.as_completed(to_do):
-                data_indices, data = future.result()
-                im[data_indices - start] = data
+                rows, data = future.result()
+                im[rows] = data
 
         logger.info(f"Loading {len(indices)} images complete")
 
@@ -2,6 +2,7 @@ import logging
 import os
 from collections import OrderedDict
 
+import numpy as np
 import pandas as pd
 from gemmi import cif
 
@@ -95,14 +96,12 @@ class StarFile:
                             "Blocks with multiple loops and/or pairs are not supported"
                         )
                     loop_tags = gemmi_item.loop.tags
-                    # convert loop data to a list of lists
-                    # using the .val(row, col) method of gemmi's Loop class
-                    loop_data = [None] * gemmi_item.loop.length()
-                    for row in range(gemmi_item.loop.length()):
-                        loop_data[row] = [
-                            gemmi_item.loop.val(row, col)
-                            for col in range(gemmi_item.loop.width())
-                        ]
+                    # gemmi's Loop class stores its values as one flat, row-major list.
+                    # Fetch it in a single call and reshape, rather than calling
+                    # .val(row, col) once per entry of the loop.
+                    loop_data = np.array(gemmi_item.loop.values, dtype=object).reshape(
+                        gemmi_item.loop.length(), gemmi_item.loop.width()
+                    )
             if block_has_pair:
                 if gemmi_block.name not in self.blocks:
                     # represent a set of pairs by a dictionary
@@ -114,7 +113,7 @@ class StarFile:
                     )
             elif block_has_loop:
                 if gemmi_block.name not in self.blocks:
-                    # initialize DF from list of lists
+                    # initialize DF from the (rows, columns) array of loop values
                     # read in with dtype=str because we do not want type conversion
                     self.blocks[gemmi_block.name] = pd.DataFrame(
                         loop_data, columns=loop_tags, dtype=str
@@ -147,10 +146,14 @@ class StarFile:
             elif isinstance(block, pd.DataFrame):
                 # initialize loop with column names
                 _loop = _block.init_loop("", list(block.columns))
-                for row in block.values.tolist():
-                    # write out as str because we do not want type conversion
-                    row = [str(row[x]) for x in range(len(row))]
-                    _loop.add_row(row)
+                # fill the whole loop at once, column by column, instead of one add_row per row
+                # write out as str because we do not want type conversion
+                _loop.set_all_values(
+                    [
+                        [str(value) for value in column]
+                        for column in block.values.T.tolist()
+                    ]
+                )
             else:
                 raise StarFileError(f"Unsupported type for block {name}: {type(block)}")
 
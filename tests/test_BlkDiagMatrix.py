@@ -5,6 +5,7 @@ import pytest
 from numpy.linalg import norm, solve
 
 from aspire.operators import BlkDiagMatrix
+from aspire.utils import utest_tolerance
 
 
 class BlkDiagMatrixTestCase(TestCase):
@@ -268,6 +269,72 @@ class BlkDiagMatrixTestCase(TestCase):
         result = np.max([norm(blk, ord=2) for blk in self.blk_a])
         self.assertTrue(result == self.blk_a.norm())
 
+    def testBlkDiagMatrixRepeatedShapes(self):
+        # Steerable bases repeat block shapes, which are processed as stacks.
+        blks = [np.random.randn(*shp) for shp in [(3, 3), (2, 2), (2, 2), (3, 3)]]
+        A = BlkDiagMatrix.from_list(blks, dtype=np.float64)
+
+        result = np.max([norm(blk, ord=2) for blk in blks])
+        self.assertTrue(np.allclose(result, A.norm()))
+
+        result = np.concatenate([np.linalg.eigvals(blk) for blk in blks])
+        self.assertTrue(np.allclose(result, A.eigvals()))
+
+        coeffm = np.random.randn(10, 2)
+        splits = np.cumsum(A.partition[:-1, 1])
+
+        result = np.concatenate(
+            [blk @ x for blk, x in zip(blks, np.split(coeffm, splits))]
+        )
+        self.assertTrue(np.allclose(result, A.apply(coeffm)))
+
+        result = np.concatenate(
+            [solve(blk, x) for blk, x in zip(blks, np.split(coeffm, splits))]
+        )
+        self.assertTrue(np.allclose(result, A.solve(coeffm)))
+
+        # Empty blocks are skipped by the stacked operations, but must keep
+        #   their place, and the dtype, of the results.
+        shapes = [(3, 3), (0, 0), (2, 2), (2, 2), (0, 0), (3, 3)]
+        # Diagonally dominant, so the single precision solves are well conditioned.
+        blks = [
+            (np.random.randn(*shp) + 10 * np.eye(*shp)).astype(np.float32)
+            for shp in shapes
+        ]
+        A = BlkDiagMatrix.from_list(blks, dtype=np.float32)
+
+        result = np.max([norm(blk, ord=2) for blk in blks if blk.size])
+        self.assertTrue(np.allclose(result, A.norm()))
+
+        result = np.concatenate([np.linalg.eigvals(blk) for blk in blks])
+        self.assertEqual(result.dtype, A.eigvals().dtype)
+        self.assertTrue(np.allclose(result, A.eigvals()))
+
+        coeffm = np.random.randn(10, 2).astype(np.float32)
+        splits = np.cumsum(A.partition[:-1, 1])
+
+        result = np.concatenate(
+            [blk @ x for blk, x in zip(blks, np.split(coeffm, splits))]
+        )
+        self.assertTrue(np.allclose(result, A.apply(coeffm)))
+
+        result = np.concatenate(
+            [solve(blk, x) for blk, x in zip(blks, np.split(coeffm, splits))]
+        )
+        self.assertTrue(
+            np.allclose(result, A.solve(coeffm), atol=utest_tolerance(np.float32))
+        )
+
+        # Empty, non square blocks map to zero rows.
+        blks = [np.random.randn(2, 2), np.empty((2, 0)), np.random.randn(2, 2)]
+        A = BlkDiagMatrix.from_list(blks, dtype=np.float64)
+        coeffm = np.random.randn(4, 2)
+
+        result = np.concatenate(
+            [blks[0] @ coeffm[:2], np.zeros((2, 2)), blks[2] @ coeffm[2:]]
+        )
+        self.assertTrue(np.allclose(result, A.apply(coeffm)))
+
     def testBlkDiagMatrixSolve(self):
         # We'll need a non singular matrix
         B = self.blk_a + self.blk_eyes
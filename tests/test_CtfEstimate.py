@@ -34,11 +34,15 @@ class CtfEstimatorTestCase(TestCase):
 
     def testEstimateCTF(self):
         with tempfile.TemporaryDirectory() as tmp_input_dir:
-            # Copy input file
-            copyfile(
-                os.path.join(DATA_DIR, self.test_input_fn),
-                os.path.join(tmp_input_dir, self.test_input_fn),
-            )
+            # Link input file, it is only read by `estimate_ctf`.
+            #   Fall back to copying it when linking is not possible,
+            #   eg. when the tmp dir is on another file system.
+            input_fn = os.path.join(DATA_DIR, self.test_input_fn)
+            tmp_input_fn = os.path.join(tmp_input_dir, self.test_input_fn)
+            try:
+                os.link(input_fn, tmp_input_fn)
+            except OSError:
+                copyfile(input_fn, tmp_input_fn)
 
             with tempfile.TemporaryDirectory() as tmp_output_dir:
                 # Returns results in output_dir
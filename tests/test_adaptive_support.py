@@ -8,6 +8,7 @@ import pytest
 from aspire.denoising import adaptive_support
 from aspire.source import ArrayImageSource
 from aspire.utils import gaussian_2d
+from aspire.utils.random import randn
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +20,7 @@ class AdaptiveSupportTest(TestCase):
 
         self.size = 1025
         self.sigma = 16
-        self.n_disc = 10
+        self.n_disc = 2
 
         # Reference thresholds. Since we're integrating 2 * r * exp(-r ** 2 /
         # (2 * sigma ** 2)), the thresholds corresponding to one, two, and
@@ -92,3 +93,41 @@ class AdaptiveSupportTest(TestCase):
             # range (too small, R is inaccurate; too big, c is inaccurate.
             self.assertTrue(abs(R - R_true) / R_true < 0.05)
             self.assertTrue(abs(c - c_true) / c_true < 0.05)
+
+    def testAdaptiveSupportCutoffAtFirstTrack(self):
+        """
+        When all Fourier energy is in the first radial track, the Fourier
+        support should be the first track, not the maximal radius.
+        """
+
+        L = 32
+        img_src = ArrayImageSource(np.ones((4, L, L)))
+
+        c, _ = adaptive_support(img_src, 0.5)
+
+        # First track is centered at half a sample, scaled to [0, 0.5].
+        self.assertEqual(c, 0.5 / L)
+
+    def testAdaptiveSupportBatchSize(self):
+        """
+        Accumulating over several batches, including a final partial batch,
+        should match processing the whole stack in a single batch.
+        """
+
+        L = 64
+        n = 7
+        # Gaussians of different widths, with noise, so that every image differs.
+        imgs = np.stack(
+            [gaussian_2d(L, sigma_x=s, sigma_y=s) for s in np.linspace(2, 8, n)]
+        )
+        imgs += 1e-3 * randn(n, L, L, seed=0)
+        img_src = ArrayImageSource(imgs)
+
+        c_ref, R_ref = adaptive_support(img_src, 0.9, batch_size=n)
+
+        # One image per batch, 3 does not divide n and leaves a smaller
+        #   last batch, and a single batch larger than the stack.
+        for batch_size in (1, 3, 10):
+            c, R = adaptive_support(img_src, 0.9, batch_size=batch_size)
+            self.assertTrue(np.allclose(c, c_ref))
+            self.assertEqual(R, R_ref)
@@ -1,3 +1,4 @@
+import copy
 import logging
 import os
 from unittest import TestCase
@@ -96,48 +97,51 @@ class FSPCATestCase(TestCase):
 
 
 class RIRClass2DTestCase(TestCase):
-    def setUp(self):
-        self.resolution = 16
-        self.dtype = np.float64
+    @classmethod
+    def setUpClass(cls):
+        # The sources and bases are only read by the tests below,
+        #   so they are built once for the whole class.
+        cls.resolution = 16
+        cls.dtype = np.float64
 
         # Create some projections
         v = Volume(
             np.load(os.path.join(DATA_DIR, "clean70SRibosome_vol.npy")).astype(
-                self.dtype
+                cls.dtype
             )
         )
-        v = v.downsample(self.resolution)
+        v = v.downsample(cls.resolution)
 
         # Clean
-        self.clean_src = Simulation(
-            L=self.resolution,
+        cls.clean_src = Simulation(
+            L=cls.resolution,
             n=321,
             vols=v,
-            dtype=self.dtype,
+            dtype=cls.dtype,
         )
 
         # With Noise
         noise_var = 0.01 * np.var(np.sum(v[0], axis=0))
         noise_filter = ScalarFilter(dim=2, value=noise_var)
-        self.noisy_src = Simulation(
-            L=self.resolution,
+        cls.noisy_src = Simulation(
+            L=cls.resolution,
             n=123,
             vols=v,
-            dtype=self.dtype,
+            dtype=cls.dtype,
             noise_filter=noise_filter,
         )
 
         # Set up FFB
         # Setup a Basis
-        self.basis = FFBBasis2D((self.resolution, self.resolution), dtype=self.dtype)
+        cls.basis = FFBBasis2D((cls.resolution, cls.resolution), dtype=cls.dtype)
 
         # Create Basis, use precomputed Basis
-        self.clean_fspca_basis = FSPCABasis(
-            self.clean_src, self.basis, noise_var=0
+        cls.clean_fspca_basis = FSPCABasis(
+            cls.clean_src, cls.basis, noise_var=0
         )  # Note noise_var assigned zero, skips eigval filtering.
 
         # Ceate another fspca_basis, use autogeneration FFB2D Basis
-        self.noisy_fspca_basis = FSPCABasis(self.noisy_src)
+        cls.noisy_fspca_basis = FSPCABasis(cls.noisy_src)
 
     def testClass2DBase(self):
         """
@@ -243,8 +247,9 @@ class RIRClass2DTestCase(TestCase):
         # Get the eigenimages
         eigimg_uncompressed = fspca.eigen_images()
 
-        # Compresses the FSPCA basis
-        compressed_fspca = fspca._compress(150)
+        # Compresses a copy of the FSPCA basis,
+        #   `_compress` modifies its instance and this one is shared by the class.
+        compressed_fspca = copy.deepcopy(fspca)._compress(150)
 
         # Get the eigenimages
         eigimg_compressed = compressed_fspca.eigen_images()
@@ -37,6 +37,16 @@ class ConfigTest(TestCase):
                 c = fft.ifft2(b, workers=nworkers)
                 self.assertTrue(xp.allclose(a, c))
 
+    def testRfft2(self):
+        for backend in test_objects:
+            xp, fft = backend
+            for nworkers in (-1, 1, 2):
+                for shape in ((100, 100), (101, 101), (3, 100, 101)):
+                    a = xp.random.random(shape)
+                    b = fft.rfft2(a, workers=nworkers)
+                    c = fft.fft2(a, workers=nworkers)
+                    self.assertTrue(xp.allclose(b, c[..., : shape[-1] // 2 + 1]))
+
     def testFftn(self):
         for backend in test_objects:
             xp, fft = backend
@@ -18,9 +18,9 @@ class ImageTestCase(TestCase):
         self.im = Image(misc.face(gray=True).astype(self.dtype)[:768, :768])
         # Construct a simple stack of Images
         self.n = 3
-        self.ims_np = np.empty((3, *self.im_np.shape[1:]), dtype=self.dtype)
-        for i in range(self.n):
-            self.ims_np[i] = self.im_np * (i + 1) / float(self.n)
+        # Scale the i-th image by (i + 1) / n, broadcasting over the stack.
+        self.scales = np.arange(1, self.n + 1, dtype=self.dtype).reshape(-1, 1, 1)
+        self.ims_np = self.im_np * self.scales / float(self.n)
         # Independent Image stack object for testing Image methods
         self.ims = Image(self.ims_np)
 
@@ -59,14 +59,11 @@ class ImageTestCase(TestCase):
             )
         )
 
-        # This is equivalent to checking np.tranpose(..., (0, 2, 1))
-        for i in range(self.ims_np.shape[0]):
+        # Check the whole stack at once, flipping it only once.
+        ims_flipped = self.ims.flip_axes().asnumpy()
+        self.assertTrue(np.allclose(ims_flipped, np.transpose(self.ims_np, (0, 2, 1))))
 
-            self.assertTrue(np.allclose(self.ims.flip_axes()[i], self.ims_np[i].T))
-
-            # Check against the contruction.
-            self.assertTrue(
-                np.allclose(
-                    self.ims.flip_axes()[i], self.im_np[0].T * (i + 1) / float(self.n)
-                )
-            )
+        # Check against the contruction.
+        self.assertTrue(
+            np.allclose(ims_flipped, self.im_np[0].T * self.scales / float(self.n))
+        )
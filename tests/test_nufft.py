@@ -838,8 +838,9 @@ class SimTestCase(TestCase):
 
         result = plan.transform(batch)
 
-        for r in range(ntransforms):
-            self.assertTrue(np.allclose(result[r], self.recip_space_plane))
+        # Compare the whole stack at once, each transform against the same plane.
+        self.assertEqual(result.shape, (ntransforms, *self.recip_space_plane.shape))
+        self.assertTrue(np.allclose(result, self.recip_space_plane))
 
     def _testAdjoint(self, backend, dtype):
         if not backend_available(backend):
@@ -878,10 +879,11 @@ class SimTestCase(TestCase):
         # Test Adjoint
         result = plan.adjoint(batch)
 
-        for r in range(ntransforms):
-            self.assertTrue(
-                np.allclose(result[r], self.adjoint_plane, atol=utest_tolerance(dtype))
-            )
+        # Compare the whole stack at once, each adjoint against the same plane.
+        self.assertEqual(result.shape, (ntransforms, *self.adjoint_plane.shape))
+        self.assertTrue(
+            np.allclose(result, self.adjoint_plane, atol=utest_tolerance(dtype))
+        )
 
     # TODO: This list could be done better, as some sort of matrix
     #    once there are no raise exceptions, but more pressing things...
@@ -50,10 +50,11 @@ class UtilsTestCase(TestCase):
 
     def testMultiplication(self):
         result = (self.rot_obj * self.rot_obj.invert()).matrices
-        for i in range(len(self.rot_obj)):
-            self.assertTrue(
-                np.allclose(np.eye(3), result[i], atol=utest_tolerance(self.dtype))
-            )
+        # Every product should be the identity, compared for the whole stack at once.
+        self.assertEqual(result.shape, (len(self.rot_obj), 3, 3))
+        self.assertTrue(
+            np.allclose(np.eye(3), result, atol=utest_tolerance(self.dtype))
+        )
 
     def testRegisterRots(self):
         q_mat = Rotation.generate_random_rotations(1, dtype=self.dtype)[0]
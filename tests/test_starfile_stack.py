@@ -15,20 +15,28 @@ DATA_DIR = os.path.join(os.path.dirname(__file__), "saved_test_data")
 
 
 class StarFileTestCase(TestCase):
-    def setUpStarFile(self, starfile_name):
+    @staticmethod
+    def loadStarFile(starfile_name):
         # set up RelionSource object for tests
         with importlib_resources.path(tests.saved_test_data, starfile_name) as starfile:
-            self.src = RelionSource(starfile, data_folder=DATA_DIR, max_rows=12)
+            return RelionSource(starfile, data_folder=DATA_DIR, max_rows=12)
 
-    def setUp(self):
-        # this method is used by StarFileMainCase but overridden by StarFileOneImage
-        self.setUpStarFile("sample_relion_data.star")
+    def setUpStarFile(self, starfile_name):
+        self.src = self.loadStarFile(starfile_name)
 
     def tearDown(self):
         pass
 
 
 class StarFileMainCase(StarFileTestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Tests which only read from the source share one, loaded once for the class.
+        cls.shared_src = cls.loadStarFile("sample_relion_data.star")
+
+    def setUp(self):
+        self.src = self.shared_src
+
     def testImageStackType(self):
         # Since src is an ImageSource, we can call images() on it to get an Image
         image_stack = self.src.images(start=0, num=np.inf)
@@ -39,6 +47,12 @@ class StarFileMainCase(StarFileTestCase):
         images = self.src.images(0, 10)
         self.assertEqual(images.shape, (10, 200, 200))
 
+    def testImageStackEmpty(self):
+        # Loading past the last image returns an empty stack of the right shape.
+        images = self.src._images(start=self.src.n)
+        self.assertEqual(images.shape, (0, 200, 200))
+        self.assertEqual(images.dtype, self.src.dtype)
+
     def testImage0(self):
         image_stack = self.src.images(0, 1)
         first_image = image_stack[0]
@@ -49,6 +63,14 @@ class StarFileMainCase(StarFileTestCase):
             )
         )
 
+    def testImagesRandomIndices(self):
+        # Images requested by unordered, non-contiguous indices should be returned
+        # in the requested order, matching a contiguous load of the same images.
+        images_in_order = self.src.images(0, 12)
+        indices = np.array([11, 3, 7, 0, 5])
+        images = self.src._images(indices=indices)
+        self.assertTrue(np.array_equal(images_in_order[indices], images.asnumpy()))
+
     def testMetadata(self):
         # The 'get_metadata' method of the StarFileStack object can be used to get metadata information
         # for a particular image index. Here we get the '_rlnCoordinateY' attribute of the first image.
@@ -57,11 +79,15 @@ class StarFileMainCase(StarFileTestCase):
         )
 
     def testImageDownsample(self):
+        # downsampling modifies the source, so use a fresh one
+        self.setUpStarFile("sample_relion_data.star")
         self.src.downsample(16)
         first_image = self.src.images(0, 1)[0]
         self.assertEqual(first_image.shape, (16, 16))
 
     def testImageDownsampleAndWhiten(self):
+        # downsampling and whitening modify the source, so use a fresh one
+        self.setUpStarFile("sample_relion_data.star")
         self.src.downsample(16)
         self.src.whiten(noise_filter=ScalarFilter(dim=2, value=0.02450909546680349))
         first_whitened_image = self.src.images(0, 1)[0]
@@ -77,23 +103,26 @@ class StarFileMainCase(StarFileTestCase):
 
 
 class StarFileSingleImage(StarFileTestCase):
-    def setUp(self):
-        # create new mrcs containing only one particle image
+    @classmethod
+    def setUpClass(cls):
+        # create new mrcs containing only one particle image, once for all tests
         with importlib_resources.path(tests.saved_test_data, "sample.mrcs") as path:
             stack_path = str(path)
-            new_mrcs_path = os.path.join(
+            cls.new_mrcs_path = os.path.join(
                 os.path.dirname(stack_path), "sample_one_image.mrcs"
             )
-            mrcs_data = mrcfile.open(stack_path, "r").data[0]
-            with mrcfile.new(new_mrcs_path) as new_mrcs:
+            # memory-map the stack so that only the first image is read from disk
+            with mrcfile.mmap(stack_path, mode="r") as mrcs:
+                mrcs_data = np.array(mrcs.data[0])
+            with mrcfile.new(cls.new_mrcs_path) as new_mrcs:
                 new_mrcs.set_data(mrcs_data)
-        self.setUpStarFile("sample_relion_one_image.star")
 
-    def tearDown(self):
-        with importlib_resources.path(
-            tests.saved_test_data, "sample_one_image.mrcs"
-        ) as path:
-            os.remove(str(path))
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.new_mrcs_path)
+
+    def setUp(self):
+        self.setUpStarFile("sample_relion_one_image.star")
 
     def testMRCSWithOneParticle(self):
         # tests conversion of 2D numpy arrays into 3D stacks in the case
@@ -5,13 +5,9 @@ from itertools import zip_longest
 from unittest import TestCase
 
 import importlib_resources
-import numpy as np
 from pandas import DataFrame
-from scipy import misc
 
 import tests.saved_test_data
-from aspire.image import Image
-from aspire.source import ArrayImageSource
 from aspire.storage import StarFile, StarFileError
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "saved_test_data")
@@ -35,25 +31,15 @@ def grouper(iterable, n, fillvalue=None):
 
 
 class StarFileTestCase(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # The STAR file is only read by the tests, so parse it once per class.
         with importlib_resources.path(
             tests.saved_test_data, "sample_data_model.star"
         ) as path:
-            self.starfile = StarFile(path)
-
-        # Independent Image object for testing Image source methods
-        L = 768
-        self.im = Image(misc.face(gray=True).astype("float64")[:L, :L])
-        self.img_src = ArrayImageSource(self.im)
-
-        # We also want to flex the stack logic.
-        self.n = 21
-        im_stack = np.broadcast_to(self.im.data, (self.n, L, L))
-        # make each image methodically different
-        im_stack = np.multiply(im_stack, np.arange(self.n)[:, None, None])
-        self.im_stack = Image(im_stack)
-        self.img_src_stack = ArrayImageSource(self.im_stack)
+            cls.starfile = StarFile(path)
 
+    def setUp(self):
         # Create a tmpdir object for this test instance
         self._tmpdir = tempfile.TemporaryDirectory()
         # Get the directory from the name attribute of the instance